@@ -11,8 +11,12 @@ Features demonstrated:
 - Laser engine setup and alignment
 - Performance monitoring
 - Weather-aware operations
+
+Set REALGIBBER_FAST_DEMO=1 to skip the pauses between demo sections, e.g.
+when timing the demo as a smoke benchmark in CI.
 """
 
+import os
 import time
 import asyncio
 from realgibber import (
@@ -53,10 +57,8 @@ def demo_range_detection():
         measurement = detector.measure_distance()
 
         print("📊 Measurement Results:")
-        print(".2f")
-        print(".3f")
-        print(".3f")
-        print(".3f")
+        print(f"   Distance: {measurement.distance_m:.2f} m")
+        print(f"   Quality: {measurement.quality_score:.3f}")
 
         # Get range category
         category = detector.get_current_range_category()
@@ -67,10 +69,8 @@ def demo_range_detection():
         avg_measurement = detector.measure_distance_averaged(10)
 
         print("📊 Averaged Measurement Results:")
-        print(".2f")
-        print(".3f")
-        print(".3f")
-        print(".3f")
+        print(f"   Distance: {avg_measurement.distance_m:.2f} m")
+        print(f"   Quality: {avg_measurement.quality_score:.3f}")
 
     except Exception as e:
         print(f"❌ Range detection error: {e}")
@@ -101,8 +101,6 @@ def demo_laser_communication():
         alignment = laser.get_alignment_status()
         print("🎯 Alignment Status:")
         print(f"   Aligned: {alignment.is_aligned}")
-        print(".2f")
-        print(".2f")
 
         # Enable adaptive mode with range detector integration
         range_detector = RangeDetector()
@@ -180,10 +178,10 @@ def demo_weather_integration():
         # Assess weather impact
         impact = weather_mgr.assess_weather_impact(mission, drone_specs)
         print("🌤️ Weather Impact Assessment:")
-        print(".2f")
+        print(f"   Overall Risk: {impact.overall_risk_score:.2f}")
         print(f"   Wind Impact: {impact.wind_impact.track_deviation_degrees:.1f}° deviation")
-        print(".1f")
-        print(".1f")
+        print(f"   Power Increase: {impact.wind_impact.increased_power_draw_w:.1f} W")
+        print(f"   Endurance Reduction: {impact.wind_impact.reduced_endurance_percent:.1f}%")
         print(f"   Recommended Actions: {len(impact.recommended_actions)} actions")
 
         # Validate mission constraints
@@ -218,17 +216,14 @@ def demo_performance_monitoring():
         print("📈 Benchmark Results:")
         for i, benchmark in enumerate(benchmarks):
             print(f"   Benchmark {i+1}: {benchmark.benchmark_type}")
-            print(".2f")
-            print(".2f")
+            print(f"   Throughput: {benchmark.throughput_mbps:.2f} Mbps")
 
         # Get current performance metrics
         current_metrics = monitor.get_current_metrics()
         if current_metrics:
             metrics = current_metrics
             print("\n📊 Current Performance Metrics:")
-            print(".2f")
-            print(".2f")
-            print(".1f")
+            print(f"   CPU Usage: {metrics.cpu_usage_percent:.1f}%")
 
     except Exception as e:
         print(f"❌ Performance monitoring error: {e}")
@@ -298,7 +293,8 @@ def main():
         print(f"\n{'='*20} {name} {'='*20}")
         success = demo_func()
         results.append((name, success))
-        time.sleep(1)  # Brief pause between demos
+        if not os.getenv("REALGIBBER_FAST_DEMO"):
+            time.sleep(1)  # Brief pause between demos
 
     # Summary
     print("\n" + "=" * 60)
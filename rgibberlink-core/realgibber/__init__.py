@@ -31,58 +31,79 @@ Example usage:
     weather.update_weather(WeatherData(...))
 """
 
-from ._core import (
+import importlib
+
+# Public name -> attribute of the compiled ``_core`` extension. Attributes are
+# resolved on first access (PEP 562) so ``import realgibber`` does not load the
+# extension module until one of them is actually used.
+_CORE_ATTRS = {
     # Core cryptographic components
-    PyCryptoEngine as CryptoEngine,
-    PyVisualEngine as VisualEngine,
-    PyVisualPayload as VisualPayload,
-    PyAudioEngine as AudioEngine,
-    PyProtocolEngine as ProtocolEngine,
-    PyRgibberLink as RgibberLink,
+    "CryptoEngine": "PyCryptoEngine",
+    "VisualEngine": "PyVisualEngine",
+    "VisualPayload": "PyVisualPayload",
+    "AudioEngine": "PyAudioEngine",
+    "ProtocolEngine": "PyProtocolEngine",
+    "RgibberLink": "PyRgibberLink",
 
     # Range detection and laser communication
-    PyRangeDetector as RangeDetector,
-    PyRangeMeasurement as RangeMeasurement,
-    PyRangeEnvironmentalConditions as RangeEnvironmentalConditions,
-    PyLaserEngine as LaserEngine,
-    PyAlignmentStatus as AlignmentStatus,
-    PyUltrasonicBeamEngine as UltrasonicBeamEngine,
-    PyOpticalECC as OpticalECC,
+    "RangeDetector": "PyRangeDetector",
+    "RangeMeasurement": "PyRangeMeasurement",
+    "RangeEnvironmentalConditions": "PyRangeEnvironmentalConditions",
+    "LaserEngine": "PyLaserEngine",
+    "AlignmentStatus": "PyAlignmentStatus",
+    "UltrasonicBeamEngine": "PyUltrasonicBeamEngine",
+    "OpticalECC": "PyOpticalECC",
 
     # Channel validation and security
-    PyChannelValidator as ChannelValidator,
-    PyChannelData as ChannelData,
-    PySecurityManager as SecurityManager,
+    "ChannelValidator": "PyChannelValidator",
+    "ChannelData": "PyChannelData",
+    "SecurityManager": "PySecurityManager",
 
     # Performance monitoring
-    PyPerformanceMonitor as PerformanceMonitor,
-    PyBenchmarkResult as BenchmarkResult,
-    PyPerformanceMetrics as PerformanceMetrics,
+    "PerformanceMonitor": "PyPerformanceMonitor",
+    "BenchmarkResult": "PyBenchmarkResult",
+    "PerformanceMetrics": "PyPerformanceMetrics",
 
     # Post-quantum cryptography
-    PyPostQuantumEngine as PostQuantumEngine,
-    PyKyberCiphertextData as KyberCiphertextData,
+    "PostQuantumEngine": "PyPostQuantumEngine",
+    "KyberCiphertextData": "PyKyberCiphertextData",
 
     # Weather and mission management
-    PyWeatherManager as WeatherManager,
-    PyWeatherData as WeatherData,
-    PyGeoCoordinate as GeoCoordinate,
-    PyWeatherImpact as WeatherImpact,
-    PyWindImpact as WindImpact,
-    PyValidationResult as ValidationResult,
-    PyConstraintViolation as ConstraintViolation,
-    PyWeatherAdaptation as WeatherAdaptation,
-    PyRiskAssessment as RiskAssessment,
-    PyMissionPayload as MissionPayload,
-    PyMissionHeader as MissionHeader,
-    PyMissionTask as MissionTask,
-    PyDroneSpecifications as DroneSpecifications,
+    "WeatherManager": "PyWeatherManager",
+    "WeatherData": "PyWeatherData",
+    "GeoCoordinate": "PyGeoCoordinate",
+    "WeatherImpact": "PyWeatherImpact",
+    "WindImpact": "PyWindImpact",
+    "ValidationResult": "PyValidationResult",
+    "ConstraintViolation": "PyConstraintViolation",
+    "WeatherAdaptation": "PyWeatherAdaptation",
+    "RiskAssessment": "PyRiskAssessment",
+    "MissionPayload": "PyMissionPayload",
+    "MissionHeader": "PyMissionHeader",
+    "MissionTask": "PyMissionTask",
+    "DroneSpecifications": "PyDroneSpecifications",
 
     # Audit and compliance
-    PyAuditSystem as AuditSystem,
-    PyAuditEntry as AuditEntry,
-    PySecurityAlert as SecurityAlert,
-)
+    "AuditSystem": "PyAuditSystem",
+    "AuditEntry": "PyAuditEntry",
+    "SecurityAlert": "PySecurityAlert",
+}
+
+
+def __getattr__(name):
+    try:
+        core_name = _CORE_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    core = importlib.import_module("._core", __name__)
+    attr = getattr(core, core_name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CORE_ATTRS))
+
 
 __version__ = "0.3.0"
 __author__ = "RealGibber Team"